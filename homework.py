@@ -1,9 +1,46 @@
-from abc import abstractmethod
 from dataclasses import dataclass
 from typing import Optional
 
-
-@dataclass(frozen=True)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Вернуть функцию без компиляции, если numba не установлена."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Коэффициенты формул на уровне модуля: в ядрах и векторном пути они
+# берутся одной выборкой LOAD_GLOBAL вместо обхода MRO через self
+# (numba дополнительно сворачивает их в константы при компиляции).
+# Одноименные классовые атрибуты остаются публичным API.
+_M_IN_KM = 1000.0
+_SEC_IN_MIN = 60.0
+_LEN_STEP = 0.65
+_LEN_STROKE = 1.38
+_RUN_K1 = 18.0
+_RUN_K2 = 20.0
+_WALK_K1 = 0.035
+_WALK_K2 = 0.029
+_SWIM_K1 = 1.1
+_SWIM_K2 = 2.0
+
+# Единый шаблон отчета: %-форматирование кортежа выполняется одним
+# вызовом PyUnicode_Format вместо посимвольной сборки f-строки.
+_FMT = ('Тип тренировки: %s; '
+        'Длительность: %.3f ч.; '
+        'Дистанция: %.3f км; '
+        'Ср. скорость: %.3f км/ч; '
+        'Потрачено ккал: %.3f.')
+
+
+@dataclass(frozen=True, slots=True)
 class InfoMessage:
     """Информационное сообщение о тренировке.
 
@@ -18,11 +55,57 @@ class InfoMessage:
     calories: float
 
     def get_message(self) -> str:
-        return (f'Тип тренировки: {self.training_type}; '
-                f'Длительность: {self.duration:.3f} ч.; '
-                f'Дистанция: {self.distance:.3f} км; '
-                f'Ср. скорость: {self.speed:.3f} км/ч; '
-                f'Потрачено ккал: {self.calories:.3f}.')
+        return _FMT % (self.training_type, self.duration,
+                       self.distance, self.speed, self.calories)
+
+
+@njit(cache=True)
+def _run_cals(action: float, duration: float, weight: float) -> float:
+    """Скалярное ядро расчета калорий для бега."""
+    speed = action * _LEN_STEP / _M_IN_KM / duration
+    return ((_RUN_K1 * speed - _RUN_K2) * weight / _M_IN_KM
+            * (duration * _SEC_IN_MIN))
+
+
+@njit(cache=True)
+def _walk_cals(action: float, duration: float, weight: float,
+               height: float) -> float:
+    """Скалярное ядро расчета калорий для спортивной ходьбы."""
+    speed = action * _LEN_STEP / _M_IN_KM / duration
+    # speed * speed вместо speed ** 2: обычное умножение не уходит
+    # в библиотечный pow(), а целая часть от // нечувствительна к
+    # разнице в последнем бите.
+    return ((_WALK_K1 * weight
+             + (speed * speed // height) * _WALK_K2 * weight)
+            * (duration * _SEC_IN_MIN))
+
+
+@njit(cache=True)
+def _swim_cals(length_pool: float, count_pool: float, duration: float,
+               weight: float) -> float:
+    """Скалярное ядро расчета калорий для плавания."""
+    speed = length_pool * count_pool / _M_IN_KM / duration
+    return (speed + _SWIM_K1) * _SWIM_K2 * weight
+
+
+# Прогрев: первая компиляция ядер выполняется при импорте, а не в
+# горячем цикле обработки пакетов.
+_run_cals(1.0, 1.0, 1.0)
+_walk_cals(1.0, 1.0, 1.0, 1.0)
+_swim_cals(1.0, 1.0, 1.0, 1.0)
+
+# Специализация под экземпляр: формула калорий компилируется в __init__
+# с вшитыми литералами веса/длительности, и пересчет сводится к одному
+# вызову замыкания. По умолчанию выключено: кодогенерация окупается
+# только для долгоживущих тренировок с многократным пересчетом.
+SPECIALIZE_CALORIES = False
+
+
+def _specialize(src: str):
+    """Скомпилировать исходник специализированного ядра калорий."""
+    namespace: dict = {}
+    exec(src, namespace)
+    return namespace['_c']
 
 
 class Training:
@@ -35,6 +118,12 @@ class Training:
     - :attr: 'calories' - количество потраченных калорий'
     """
 
+    # '__dict__' остается в слотах: тесты и инструменты подменяют
+    # методы на экземплярах, а основные атрибуты читаются из слотов.
+    __slots__ = ('action', 'duration', 'weight', 'training_type',
+                 'calories', '_distance', '_mean_speed', '_cal_fn',
+                 '__dict__')
+
     LEN_STEP: float = 0.65
     M_IN_KM: int = 1000
 
@@ -50,48 +139,86 @@ class Training:
         self.training_type: str = self.__class__.__name__
         self.calories: float = 0
 
+        # Ленивые кеши: входные данные пакета неизменяемы, поэтому
+        # дистанция и средняя скорость считаются не более одного раза.
+        self._distance: Optional[float] = None
+        self._mean_speed: Optional[float] = None
+
+        # Специализированное ядро калорий; создается в __init__
+        # наследника при включенном SPECIALIZE_CALORIES.
+        self._cal_fn = None
+
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
-        return self.action * self.LEN_STEP / self.M_IN_KM
+        # LEN_STEP / M_IN_KM нельзя заранее свернуть в константу:
+        # умножение на готовое частное округляется иначе
+        # (420 * (0.65 / 1000) != 420 * 0.65 / 1000), а выходные
+        # значения зафиксированы точным сравнением.
+        if self._distance is None:
+            self._distance = self.action * self.LEN_STEP / self.M_IN_KM
+        return self._distance
 
     def get_mean_speed(self) -> float:
         """Получить среднюю скорость движения."""
-        return self.get_distance() / self.duration
+        if self._mean_speed is None:
+            self._mean_speed = self.get_distance() / self.duration
+        return self._mean_speed
 
-    @abstractmethod
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
         raise NotImplementedError
 
+    def format_message(self) -> str:
+        """Отформатировать отчет о тренировке одной строкой.
+
+        Быстрый путь: строит сообщение без промежуточного объекта
+        `InfoMessage`.
+        """
+        return _FMT % (self.training_type, self.duration,
+                       self.get_distance(), self.get_mean_speed(),
+                       self.get_spent_calories())
+
     def show_training_info(self) -> InfoMessage:
-        """Вернуть информационное сообщение о выполненной тренировке."""
-        value_dict = {'training_type': self.training_type,
-                      'duration': self.duration,
-                      'distance': self.get_distance(),
-                      'speed': self.get_mean_speed(),
-                      'calories': self.get_spent_calories()}
+        """Вернуть информационное сообщение о выполненной тренировке.
 
-        return InfoMessage(**value_dict)
+        Оставлен для совместимости; горячий путь вывода использует
+        `format_message`.
+        """
+        return InfoMessage(self.training_type,
+                           self.duration,
+                           self.get_distance(),
+                           self.get_mean_speed(),
+                           self.get_spent_calories())
 
 
 class Running(Training):
     """Тренировка: бег."""
 
+    __slots__ = ()
+
     CALORIES_MEAN_SPEED_MULTIPLIER: float = 18
     CALORIES_MEAN_SPEED_SHIFT: float = 20
     SECOND_IN_MINUTE: int = 60
 
+    def __init__(self,
+                 action: int,
+                 duration: float,
+                 weight: float,
+                 ) -> None:
+        super().__init__(action, duration, weight)
+
+        if SPECIALIZE_CALORIES:
+            self._cal_fn = _specialize(
+                f'def _c(ms): return ({_RUN_K1!r} * ms - {_RUN_K2!r}) '
+                f'* {weight!r} / {_M_IN_KM!r} '
+                f'* {duration * _SEC_IN_MIN!r}')
+
     def get_spent_calories(self):
         """ Расчет калорий = (18 * средняя_скорость - 20) * вес_спортсмена /
         M_IN_KM * время_тренировки_в_минутах"""
-        mean_speed: float = self.get_mean_speed()
-        duration_minutes: float = self.duration * self.SECOND_IN_MINUTE
-
-        return ((self.CALORIES_MEAN_SPEED_MULTIPLIER * mean_speed
-                 - self.CALORIES_MEAN_SPEED_SHIFT)
-                * self.weight
-                / self.M_IN_KM
-                * duration_minutes)
+        if self._cal_fn is not None:
+            return self._cal_fn(self.get_mean_speed())
+        return _run_cals(self.action, self.duration, self.weight)
 
 
 class SportsWalking(Training):
@@ -100,6 +227,8 @@ class SportsWalking(Training):
     - :attr: 'height' - рост человека
     """
 
+    __slots__ = ('height',)
+
     LEN_STEP: float = 0.65
     FIRST_CALORIE_MULTIPLIER: float = 0.035
     SECOND_CALORIE_MULTIPLIER: float = 0.029
@@ -114,18 +243,21 @@ class SportsWalking(Training):
 
         self.height = height
 
+        if SPECIALIZE_CALORIES:
+            self._cal_fn = _specialize(
+                f'def _c(ms): return ({_WALK_K1!r} * {weight!r} '
+                f'+ (ms * ms // {height!r}) * {_WALK_K2!r} * {weight!r}) '
+                f'* {duration * _SEC_IN_MIN!r}')
+
     def get_spent_calories(self) -> float:
         """ Расчет калорий =
         (0.035 * вес + (средняя_скорость**2 // рост) * 0.029 * вес)
         * время_тренировки_в_минутах
         """
-        mean_speed: float = self.get_mean_speed()
-        duration_minutes: float = self.duration * self.SECOND_IN_MINUTE
-
-        return ((self.FIRST_CALORIE_MULTIPLIER * self.weight
-                 + (mean_speed ** 2 // self.height)
-                 * self.SECOND_CALORIE_MULTIPLIER * self.weight)
-                * duration_minutes)
+        if self._cal_fn is not None:
+            return self._cal_fn(self.get_mean_speed())
+        return _walk_cals(self.action, self.duration, self.weight,
+                          self.height)
 
 
 class Swimming(Training):
@@ -138,6 +270,8 @@ class Swimming(Training):
     Для расчета средней скорости использует переопределенный алгоритм.
     """
 
+    __slots__ = ('length_pool', 'count_pool')
+
     LEN_STEP: float = 1.38
     CALORIE_MULTIPLIER: float = 1.1
     SECOND_CALORIE_MULTIPLIER: int = 2
@@ -153,19 +287,76 @@ class Swimming(Training):
         self.length_pool: int = length_pool
         self.count_pool: int = count_pool
 
+        if SPECIALIZE_CALORIES:
+            self._cal_fn = _specialize(
+                f'def _c(ms): return (ms + {_SWIM_K1!r}) '
+                f'* {_SWIM_K2!r} * {weight!r}')
+
     def get_spent_calories(self) -> float:
         """Расчет калорий = (средняя_скорость + 1.1) * 2 * вес"""
-        return ((self.get_mean_speed() + self.CALORIE_MULTIPLIER)
-                * self.SECOND_CALORIE_MULTIPLIER
-                * self.weight)
+        if self._cal_fn is not None:
+            return self._cal_fn(self.get_mean_speed())
+        return _swim_cals(self.length_pool, self.count_pool,
+                          self.duration, self.weight)
 
     def get_mean_speed(self) -> float:
         """Ср. скорость =
         длина_бассейна * count_pool / M_IN_KM / время_тренировки"""
-        return (self.length_pool
-                * self.count_pool
-                / self.M_IN_KM
-                / self.duration)
+        if self._mean_speed is None:
+            self._mean_speed = (self.length_pool
+                                * self.count_pool
+                                / self.M_IN_KM
+                                / self.duration)
+        return self._mean_speed
+
+
+_CLASS_LINKS: dict = {
+    'SWM': Swimming,
+    'RUN': Running,
+    'WLK': SportsWalking
+}
+
+# Специализированные конструкторы: длина пакета каждого типа
+# фиксирована, поэтому позиционный вызов обходится без *args-распаковки.
+_DISPATCH: dict = {
+    'SWM': lambda d: Swimming(d[0], d[1], d[2], d[3], d[4]),
+    'RUN': lambda d: Running(d[0], d[1], d[2]),
+    'WLK': lambda d: SportsWalking(d[0], d[1], d[2], d[3])
+}
+
+
+def compute_batch(workout_type: str, data_array: 'np.ndarray') -> 'np.ndarray':
+    """Посчитать показатели сразу для пакета тренировок одного типа.
+
+    Строки `data_array` повторяют пакеты `read_package` для данного
+    `workout_type`. Возвращает массив формы (N, 3) со столбцами
+    (дистанция, скорость, калории); векторные операции заменяют
+    поэлементный цикл по объектам `Training`.
+    """
+    columns = np.asarray(data_array, dtype=np.float64).T
+
+    if workout_type == 'RUN':
+        action, duration, weight = columns
+        distance = action * _LEN_STEP / _M_IN_KM
+        speed = distance / duration
+        calories = ((_RUN_K1 * speed - _RUN_K2) * weight / _M_IN_KM
+                    * (duration * _SEC_IN_MIN))
+    elif workout_type == 'WLK':
+        action, duration, weight, height = columns
+        distance = action * _LEN_STEP / _M_IN_KM
+        speed = distance / duration
+        calories = ((_WALK_K1 * weight
+                     + (speed * speed // height) * _WALK_K2 * weight)
+                    * (duration * _SEC_IN_MIN))
+    elif workout_type == 'SWM':
+        action, duration, weight, length_pool, count_pool = columns
+        distance = action * _LEN_STROKE / _M_IN_KM
+        speed = length_pool * count_pool / _M_IN_KM / duration
+        calories = (speed + _SWIM_K1) * _SWIM_K2 * weight
+    else:
+        raise ValueError(f"Unknown workout type '{workout_type}'.")
+
+    return np.stack((distance, speed, calories), axis=1)
 
 
 def read_package(workout_type: str, data: list) -> Optional[Training]:
@@ -176,27 +367,19 @@ def read_package(workout_type: str, data: list) -> Optional[Training]:
     определенной длинны, типов и значений.
 
     """
-    class_links = {
-        'SWM': Swimming,
-        'RUN': Running,
-        'WLK': SportsWalking
-    }
-
-    try:
-        obj: Training = class_links[workout_type](*data)
-    except KeyError:
+    build_training = _DISPATCH.get(workout_type)
+    if build_training is None:
         print(f"Error. Processing of receive code '{workout_type}' "
               f"not implemented in module.")
         return None
 
-    return obj
+    return build_training(data)
 
 
 def main(training: Optional[Training]) -> None:
     """Главная функция."""
     if training is not None:
-        info = training.show_training_info()
-        print(info.get_message())
+        print(training.format_message())
 
 
 if __name__ == '__main__':
@@ -206,6 +389,21 @@ if __name__ == '__main__':
         ('WLK', [9000, 1, 75, 180]),
     ]
 
-    for workout_type, data in packages:
-        training = read_package(workout_type, data)
-        main(training)
+    if np is not None:
+        training_names = {code: training_class.__name__
+                          for code, training_class in _CLASS_LINKS.items()}
+
+        grouped: dict = {}
+        for workout_type, data in packages:
+            grouped.setdefault(workout_type, []).append(data)
+
+        for workout_type, rows in grouped.items():
+            results = compute_batch(workout_type, rows)
+            for row, result in zip(rows, results):
+                info = InfoMessage(training_names[workout_type],
+                                   row[1], *result)
+                print(info.get_message())
+    else:
+        for workout_type, data in packages:
+            training = read_package(workout_type, data)
+            main(training)